@@ -25,10 +25,10 @@
 
 from decimal import Decimal
 from functools import partial
-from typing import TYPE_CHECKING, Optional, Union, Callable
+from typing import TYPE_CHECKING, Optional, Union, Callable, Dict
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QIcon, QAction
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QGridLayout, QPushButton, QLineEdit, QToolButton, QMenu
 
@@ -51,11 +51,15 @@ if TYPE_CHECKING:
     from .main_window import ElectrumWindow
 
 from .transaction_dialog import TxSizeLabel, TxFiatLabel, TxInOutWidget
-from .fee_slider import FeeSlider, FeeComboBox
 from .amountedit import FeerateEdit, BTCAmountEdit
 from .locktimeedit import LockTimeEdit
 
 
+def _feerate_decimal_point() -> int:
+    # feerates are shown in sat/vbyte
+    return 0
+
+
 class TxEditor(WindowModalDialog):
 
     def __init__(self, *, title='',
@@ -77,13 +81,28 @@ class TxEditor(WindowModalDialog):
         self.feerounding_sats = 0
         self.not_enough_funds = False
         self.no_dynfee_estimates = False
+        # confirmed_only -> whether we could pay with zero fees, computed along with self.tx
+        self._can_pay_zero_fee = {}  # type: Dict[bool, bool]
         self.needs_update = False
+        self._editor_updates_stopped = False
+        # signal connections made through _connect, disconnected in stop_editor_updates
+        self._connections = []
+        # note: ColorScheme.dark_scheme is only set at startup, after this module is
+        # imported, so the stylesheets cannot be computed at module level.
+        self._css_default = ColorScheme.DEFAULT.as_stylesheet()
+        self._css_red = ColorScheme.RED.as_stylesheet()
+        self._css_blue = ColorScheme.BLUE.as_stylesheet()
+        # last stylesheets applied by entry_changed, to avoid redundant setStyleSheet calls
+        self._fee_css = self._feerate_css = None
+        self._entry_changed_blocked = False
+        # inputs of the last update_fee_fields call, see there
+        self._last_fee_fields_state = None
         # preview is disabled for lightning channel funding
         self.allow_preview = allow_preview
         self.is_preview = False
 
         self.locktime_e = LockTimeEdit(self)
-        self.locktime_e.valueEdited.connect(self.trigger_update)
+        self._connect(self.locktime_e.valueEdited, self.trigger_update)
         self.locktime_label = QLabel(_("LockTime") + ": ")
         self.io_widget = TxInOutWidget(self.main_window, self.wallet)
         self.create_fee_controls()
@@ -111,12 +130,21 @@ class TxEditor(WindowModalDialog):
         self.update_fee_target()
         self.resize(self.layout().sizeHint())
 
-        self.main_window.gui_object.timer.timeout.connect(self.timer_actions)
-
+    def schedule_update(self):
+        # coalesce update requests into a single update on the next event loop iteration
+        if self.needs_update or self._editor_updates_stopped:
+            return
+        self.needs_update = True
+        QTimer.singleShot(0, self._do_scheduled_update)
 
-    def timer_actions(self):
-        if self.needs_update:
+    @pyqtSlot()
+    def _do_scheduled_update(self):
+        if self._editor_updates_stopped:
+            return
+        try:
             self.update()
+        finally:
+            # requests made while updating (e.g. by entry_changed) are dropped
             self.needs_update = False
 
     def update(self):
@@ -124,8 +152,19 @@ class TxEditor(WindowModalDialog):
         self.set_locktime()
         self._update_widgets()
 
+    def _connect(self, signal, slot):
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
     def stop_editor_updates(self):
-        self.main_window.gui_object.timer.timeout.disconnect(self.timer_actions)
+        self._editor_updates_stopped = True
+        # drop our signal connections, so that PyQt releases its references to the slots
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # already disconnected
+        self._connections.clear()
 
     def set_fee_config(self, dyn, pos, fee_rate):
         if dyn:
@@ -136,8 +175,9 @@ class TxEditor(WindowModalDialog):
         else:
             self.config.cv.FEE_EST_STATIC_FEERATE.set(fee_rate, save=False)
 
-    def update_tx(self, *, fallback_to_zero_fee: bool = False):
-        # expected to set self.tx, self.message and self.error
+    def update_tx(self):
+        # called by update(). expected to set self.tx, self.message and self.error
+        # note: subclasses that build the tx asynchronously (ConfirmTxDialog) override update() instead
         raise NotImplementedError()
 
     def update_fee_target(self):
@@ -145,6 +185,7 @@ class TxEditor(WindowModalDialog):
         self.fee_target.setText(text)
         self.fee_target.setVisible(bool(text)) # hide in static mode
 
+    @pyqtSlot()
     def update_feerate_label(self):
         self.feerate_label.setText(self.feerate_e.text() + ' ' + self.feerate_e.base_unit())
 
@@ -156,7 +197,7 @@ class TxEditor(WindowModalDialog):
         self.size_label = TxSizeLabel()
         self.size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.size_label.setAmount(0)
-        self.size_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+        self.size_label.setStyleSheet(self._css_default)
 
         self.feerate_label = QLabel('')
         self.feerate_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
@@ -164,42 +205,44 @@ class TxEditor(WindowModalDialog):
         self.fiat_fee_label = TxFiatLabel()
         self.fiat_fee_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.fiat_fee_label.setAmount(0)
-        self.fiat_fee_label.setStyleSheet(ColorScheme.DEFAULT.as_stylesheet())
+        self.fiat_fee_label.setStyleSheet(self._css_default)
 
-        self.feerate_e = FeerateEdit(lambda: 0)
+        self.feerate_e = FeerateEdit(_feerate_decimal_point)
         self.feerate_e.setAmount(self.config.fee_per_byte())
-        self.feerate_e.textEdited.connect(partial(self.on_fee_or_feerate, self.feerate_e, False))
-        self.feerate_e.editingFinished.connect(partial(self.on_fee_or_feerate, self.feerate_e, True))
+        self._connect(self.feerate_e.textEdited, self._on_feerate_edited)
+        self._connect(self.feerate_e.editingFinished, self._on_feerate_finished)
         self.update_feerate_label()
 
         self.fee_e = BTCAmountEdit(self.main_window.get_decimal_point)
-        self.fee_e.textEdited.connect(partial(self.on_fee_or_feerate, self.fee_e, False))
-        self.fee_e.editingFinished.connect(partial(self.on_fee_or_feerate, self.fee_e, True))
+        self._connect(self.fee_e.textEdited, self._on_fee_edited)
+        self._connect(self.fee_e.editingFinished, self._on_fee_finished)
 
         self.feerate_e.setFixedWidth(150)
         self.fee_e.setFixedWidth(150)
 
-        self.fee_e.textChanged.connect(self.entry_changed)
-        self.feerate_e.textChanged.connect(self.entry_changed)
+        self._connect(self.fee_e.textChanged, self.entry_changed)
+        self._connect(self.feerate_e.textChanged, self.entry_changed)
 
         self.fee_target = QLabel('')
         self.fee_slider = FeeSlider(self, self.config, self.fee_slider_callback)
         self.fee_combo = FeeComboBox(self.fee_slider)
         self.fee_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
+        self._feerounding_help_tail = (
+            _('To somewhat protect your privacy, Electrum tries to create change with similar precision to other outputs.') + ' ' +
+            _('At most 100 satoshis might be lost due to this rounding.') + ' ' +
+            _("You can disable this setting in '{}'.").format(_('Preferences')) + '\n' +
+            _('Also, dust is not kept as change, but added to the fee.')  + '\n' +
+            _('Also, when batching RBF transactions, BIP 125 imposes a lower bound on the fee.'))
+
         def feerounding_onclick():
-            text = (self.feerounding_text() + '\n\n' +
-                    _('To somewhat protect your privacy, Electrum tries to create change with similar precision to other outputs.') + ' ' +
-                    _('At most 100 satoshis might be lost due to this rounding.') + ' ' +
-                    _("You can disable this setting in '{}'.").format(_('Preferences')) + '\n' +
-                    _('Also, dust is not kept as change, but added to the fee.')  + '\n' +
-                    _('Also, when batching RBF transactions, BIP 125 imposes a lower bound on the fee.'))
+            text = self.feerounding_text() + '\n\n' + self._feerounding_help_tail
             self.show_message(title=_('Fee rounding'), msg=text)
 
         self.feerounding_icon = QToolButton()
         self.feerounding_icon.setStyleSheet("background-color: rgba(255, 255, 255, 0); ")
         self.feerounding_icon.setAutoRaise(True)
-        self.feerounding_icon.clicked.connect(feerounding_onclick)
+        self._connect(self.feerounding_icon.clicked, feerounding_onclick)
         self.set_feerounding_visibility(False)
 
         self.fee_hbox = fee_hbox = QHBoxLayout()
@@ -230,22 +273,45 @@ class TxEditor(WindowModalDialog):
         self.messages = []
         self.error = ''
         self._update_widgets()
-        self.needs_update = True
+        self.schedule_update()
 
     def fee_slider_callback(self, dyn, pos, fee_rate):
         self.set_fee_config(dyn, pos, fee_rate)
         self.fee_slider.activate()
-        if fee_rate:
-            fee_rate = Decimal(fee_rate)
-            self.feerate_e.setAmount(quantize_feerate(fee_rate / 1000))
-        else:
-            self.feerate_e.setAmount(None)
-        self.fee_e.setModified(False)
+        # entry_changed is called once below, not for each textChanged emitted while setting the feerate
+        self._entry_changed_blocked = True
+        try:
+            if fee_rate:
+                # sat/kvbyte -> sat/vbyte. scaleb is an exact shift of the exponent,
+                # integer division would drop the sub-satoshi digit.
+                self.feerate_e.setAmount(quantize_feerate(Decimal(fee_rate).scaleb(-3)))
+            else:
+                self.feerate_e.setAmount(None)
+            self.fee_e.setModified(False)
+        finally:
+            self._entry_changed_blocked = False
+        self.entry_changed()
         self.update_fee_target()
         self.update_feerate_label()
         self.trigger_update()
 
-    def on_fee_or_feerate(self, edit_changed, editing_finished):
+    @pyqtSlot()
+    def _on_fee_edited(self):
+        self._on_fee_or_feerate(self.fee_e, False)
+
+    @pyqtSlot()
+    def _on_fee_finished(self):
+        self._on_fee_or_feerate(self.fee_e, True)
+
+    @pyqtSlot()
+    def _on_feerate_edited(self):
+        self._on_fee_or_feerate(self.feerate_e, False)
+
+    @pyqtSlot()
+    def _on_feerate_finished(self):
+        self._on_fee_or_feerate(self.feerate_e, True)
+
+    def _on_fee_or_feerate(self, edit_changed, editing_finished):
         edit_other = self.feerate_e if edit_changed == self.fee_e else self.fee_e
         if editing_finished:
             if edit_changed.get_amount() is None:
@@ -262,12 +328,14 @@ class TxEditor(WindowModalDialog):
             self.trigger_update()
 
     def is_send_fee_frozen(self):
-        return self.fee_e.isVisible() and self.fee_e.isModified() \
-               and (self.fee_e.text() or self.fee_e.hasFocus())
+        fee_e = self.fee_e
+        return fee_e.isVisible() and fee_e.isModified() \
+               and (fee_e.text() or fee_e.hasFocus())
 
     def is_send_feerate_frozen(self):
-        return self.feerate_e.isVisible() and self.feerate_e.isModified() \
-               and (self.feerate_e.text() or self.feerate_e.hasFocus())
+        feerate_e = self.feerate_e
+        return feerate_e.isVisible() and feerate_e.isModified() \
+               and (feerate_e.text() or feerate_e.hasFocus())
 
     def feerounding_text(self):
         return (_('Additional {} satoshis are going to be added.').format(self.feerounding_sats))
@@ -278,43 +346,55 @@ class TxEditor(WindowModalDialog):
         self.feerounding_icon.setEnabled(b)
 
     def get_fee_estimator(self):
-        if self.is_send_fee_frozen() and self.fee_e.get_amount() is not None:
-            fee_estimator = self.fee_e.get_amount()
-        elif self.is_send_feerate_frozen() and self.feerate_e.get_amount() is not None:
-            amount = self.feerate_e.get_amount()  # sat/byte feerate
-            amount = 0 if amount is None else amount * 1000  # sat/kilobyte feerate
+        if self.is_send_fee_frozen() and (fee := self.fee_e.get_amount()) is not None:
+            fee_estimator = fee
+        elif self.is_send_feerate_frozen() and (amount := self.feerate_e.get_amount()) is not None:
+            # amount is a sat/byte feerate
             fee_estimator = partial(
-                SimpleConfig.estimate_fee_for_feerate, amount)
+                SimpleConfig.estimate_fee_for_feerate, amount * 1000)  # sat/kilobyte feerate
         else:
             fee_estimator = None
         return fee_estimator
 
+    @pyqtSlot()
     def entry_changed(self):
+        if self._entry_changed_blocked:
+            return
         # blue color denotes auto-filled values
         text = ""
-        fee_color = ColorScheme.DEFAULT
-        feerate_color = ColorScheme.DEFAULT
+        fee_css = self._css_default
+        feerate_css = self._css_default
         if self.not_enough_funds:
-            fee_color = ColorScheme.RED
-            feerate_color = ColorScheme.RED
+            fee_css = self._css_red
+            feerate_css = self._css_red
         elif self.fee_e.isModified():
-            feerate_color = ColorScheme.BLUE
+            feerate_css = self._css_blue
         elif self.feerate_e.isModified():
-            fee_color = ColorScheme.BLUE
+            fee_css = self._css_blue
         else:
-            fee_color = ColorScheme.BLUE
-            feerate_color = ColorScheme.BLUE
-        self.fee_e.setStyleSheet(fee_color.as_stylesheet())
-        self.feerate_e.setStyleSheet(feerate_color.as_stylesheet())
+            fee_css = self._css_blue
+            feerate_css = self._css_blue
+        if fee_css is not self._fee_css:
+            self.fee_e.setStyleSheet(fee_css)
+            self._fee_css = fee_css
+        if feerate_css is not self._feerate_css:
+            self.feerate_e.setStyleSheet(feerate_css)
+            self._feerate_css = feerate_css
         #
-        self.needs_update = True
+        self.schedule_update()
 
-    def update_fee_fields(self):
+    def update_fee_fields(self, size: int, fee: Optional[int]):
+        # size and fee are those of self.tx, computed once by the caller
         freeze_fee = self.is_send_fee_frozen()
         freeze_feerate = self.is_send_feerate_frozen()
-        tx = self.tx
-        if self.no_dynfee_estimates and tx:
-            size = tx.estimated_size()
+        # skip if nothing changed since the last call. The state is reset whenever
+        # the widgets are updated without a tx, e.g. in trigger_update.
+        state = (size, fee, freeze_fee, freeze_feerate, self.fee_slider.is_active(),
+                 self.not_enough_funds, self.no_dynfee_estimates)
+        if state == self._last_fee_fields_state:
+            return
+        self._last_fee_fields_state = state
+        if self.no_dynfee_estimates:
             self.size_label.setAmount(size)
             #self.size_e.setAmount(size)
         if self.not_enough_funds or self.no_dynfee_estimates:
@@ -325,10 +405,6 @@ class TxEditor(WindowModalDialog):
             self.set_feerounding_visibility(False)
             return
 
-        assert tx is not None
-        size = tx.estimated_size()
-        fee = tx.get_fee()
-
         #self.size_e.setAmount(size)
         self.size_label.setAmount(size)
         fiat_fee = self.main_window.format_fiat_and_units(fee)
@@ -368,10 +444,10 @@ class TxEditor(WindowModalDialog):
 
     def create_buttons_bar(self):
         self.preview_button = QPushButton(_('Preview'))
-        self.preview_button.clicked.connect(self.on_preview)
+        self._connect(self.preview_button.clicked, self.on_preview)
         self.preview_button.setVisible(self.allow_preview)
         self.ok_button = QPushButton(_('OK'))
-        self.ok_button.clicked.connect(self.on_send)
+        self._connect(self.ok_button.clicked, self.on_send)
         self.ok_button.setDefault(True)
         buttons = Buttons(CancelButton(self), self.preview_button, self.ok_button)
         return buttons
@@ -379,8 +455,27 @@ class TxEditor(WindowModalDialog):
     def create_top_bar(self, text):
         self.pref_menu = QMenu()
         self.pref_menu.setToolTipsVisible(True)
+        # the menu entries are only created when the menu is shown for the first time
+        self._connect(self.pref_menu.aboutToShow, self._populate_pref_menu)
+        self.pref_button = QToolButton()
+        self.pref_button.setIcon(read_QIcon("preferences.png"))
+        self.pref_button.setMenu(self.pref_menu)
+        self.pref_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
+        self.pref_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        hbox = QHBoxLayout()
+        hbox.addWidget(QLabel(text))
+        hbox.addStretch()
+        hbox.addWidget(self.pref_button)
+        return hbox
+
+    @pyqtSlot()
+    def _populate_pref_menu(self):
+        if self.pref_menu.actions():
+            return
         def add_pref_action(b, action, text, tooltip):
-            m = self.pref_menu.addAction(text, action)
+            m = QAction(text, self)
+            self._connect(m.triggered, action)
+            self.pref_menu.addAction(m)
             m.setCheckable(True)
             m.setChecked(b)
             m.setToolTip(tooltip)
@@ -414,71 +509,74 @@ class TxEditor(WindowModalDialog):
         add_cv_action(self.config.cv.WALLET_MERGE_DUPLICATE_OUTPUTS, self.toggle_merge_duplicate_outputs)
         add_cv_action(self.config.cv.WALLET_SPEND_CONFIRMED_ONLY, self.toggle_confirmed_only)
         add_cv_action(self.config.cv.WALLET_COIN_CHOOSER_OUTPUT_ROUNDING, self.toggle_output_rounding)
-        self.pref_button = QToolButton()
-        self.pref_button.setIcon(read_QIcon("preferences.png"))
-        self.pref_button.setMenu(self.pref_menu)
-        self.pref_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        self.pref_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        hbox = QHBoxLayout()
-        hbox.addWidget(QLabel(text))
-        hbox.addStretch()
-        hbox.addWidget(self.pref_button)
-        return hbox
 
     def resize_to_fit_content(self):
+        # activate the layout first, so that the size hint reflects the widgets we just showed/hid
+        layout = self.layout()
+        layout.activate()
         # fixme: calling resize once is not enough...
-        size = self.layout().sizeHint()
+        size = layout.sizeHint()
         self.resize(size)
         self.resize(size)
 
+    @pyqtSlot()
     def toggle_output_rounding(self):
         b = not self.config.WALLET_COIN_CHOOSER_OUTPUT_ROUNDING
         self.config.WALLET_COIN_CHOOSER_OUTPUT_ROUNDING = b
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_use_change(self):
         self.wallet.use_change = not self.wallet.use_change
         self.wallet.db.put('use_change', self.wallet.use_change)
         self.use_multi_change_menu.setEnabled(self.wallet.use_change)
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_multiple_change(self):
         self.wallet.multiple_change = not self.wallet.multiple_change
         self.wallet.db.put('multiple_change', self.wallet.multiple_change)
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_batch_rbf(self):
         b = not self.config.WALLET_BATCH_RBF
         self.config.WALLET_BATCH_RBF = b
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_merge_duplicate_outputs(self):
         b = not self.config.WALLET_MERGE_DUPLICATE_OUTPUTS
         self.config.WALLET_MERGE_DUPLICATE_OUTPUTS = b
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_send_change_to_lightning(self):
         b = not self.config.WALLET_SEND_CHANGE_TO_LIGHTNING
         self.config.WALLET_SEND_CHANGE_TO_LIGHTNING = b
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_confirmed_only(self):
         b = not self.config.WALLET_SPEND_CONFIRMED_ONLY
         self.config.WALLET_SPEND_CONFIRMED_ONLY = b
         self.trigger_update()
 
+    @pyqtSlot()
     def toggle_io_visibility(self):
         b = not self.config.GUI_QT_TX_EDITOR_SHOW_IO
         self.config.GUI_QT_TX_EDITOR_SHOW_IO = b
         self.set_io_visible(b)
         self.resize_to_fit_content()
 
+    @pyqtSlot()
     def toggle_fee_details(self):
         b = not self.config.GUI_QT_TX_EDITOR_SHOW_FEE_DETAILS
         self.config.GUI_QT_TX_EDITOR_SHOW_FEE_DETAILS = b
         self.set_fee_edit_visible(b)
         self.resize_to_fit_content()
 
+    @pyqtSlot()
     def toggle_locktime(self):
         b = not self.config.GUI_QT_TX_EDITOR_SHOW_LOCKTIME
         self.config.GUI_QT_TX_EDITOR_SHOW_LOCKTIME = b
@@ -509,9 +607,11 @@ class TxEditor(WindowModalDialog):
         self.deleteLater()  # see #3956
         return self.tx if not cancelled else None
 
+    @pyqtSlot()
     def on_send(self):
         self.accept()
 
+    @pyqtSlot()
     def on_preview(self):
         self.is_preview = True
         self.accept()
@@ -522,9 +622,9 @@ class TxEditor(WindowModalDialog):
         if self.not_enough_funds:
             self.error = _('Not enough funds.')
             confirmed_only = self.config.WALLET_SPEND_CONFIRMED_ONLY
-            if confirmed_only and self.can_pay_assuming_zero_fees(confirmed_only=False):
+            if confirmed_only and self._can_pay_zero_fee.get(False):
                 self.error += ' ' + _('Change your settings to allow spending unconfirmed coins.')
-            elif self.can_pay_assuming_zero_fees(confirmed_only=confirmed_only):
+            elif self._can_pay_zero_fee.get(confirmed_only):
                 self.error += ' ' + _('You need to set a lower fee.')
             else:
                 self.error += ''
@@ -532,14 +632,17 @@ class TxEditor(WindowModalDialog):
             if self.not_enough_funds:
                 self.io_widget.update(None)
             self.set_feerounding_visibility(False)
+            self._last_fee_fields_state = None
             self.messages = [_('Preparing transaction...')]
         else:
+            size = self.tx.estimated_size()
+            fee = self.tx.get_fee()
             self.messages = self.get_messages()
-            self.update_fee_fields()
+            self.update_fee_fields(size, fee)
             if self.locktime_e.get_locktime() is None:
                 self.locktime_e.set_locktime(self.tx.locktime)
             self.io_widget.update(self.tx)
-            self.fee_label.setText(self.main_window.config.format_amount_and_units(self.tx.get_fee()))
+            self.fee_label.setText(self.main_window.config.format_amount_and_units(fee))
             self._update_extra_fees()
 
         self._update_send_button()
@@ -595,9 +698,9 @@ class TxEditor(WindowModalDialog):
         pass
 
     def _update_message(self):
-        style = ColorScheme.RED if self.error else ColorScheme.BLUE
+        style = self._css_red if self.error else self._css_blue
         message_str = '\n'.join(self.messages) if self.messages else ''
-        self.message_label.setStyleSheet(style.as_stylesheet())
+        self.message_label.setStyleSheet(style)
         self.message_label.setText(self.error or message_str)
 
     def _update_send_button(self):
@@ -611,6 +714,7 @@ class ConfirmTxDialog(TxEditor):
 
     def __init__(self, *, window: 'ElectrumWindow', make_tx, output_value: Union[int, str], allow_preview=True):
 
+        self._req_gen = 0  # incremented whenever pending make_tx requests become outdated
         TxEditor.__init__(
             self,
             window=window,
@@ -634,38 +738,87 @@ class ConfirmTxDialog(TxEditor):
             amount_str = self.main_window.format_amount_and_units(amount)
         self.amount_label.setText(amount_str)
 
-    def update_tx(self, *, fallback_to_zero_fee: bool = False):
+    def trigger_update(self):
+        self._req_gen += 1
+        TxEditor.trigger_update(self)
+
+    def update(self):
+        # make_tx runs coin selection, which can be slow for wallets with many coins,
+        # so it is run in the window's task thread. Outdated requests are skipped,
+        # and their results dropped.
+        self._req_gen += 1
+        req_gen = self._req_gen
         fee_estimator = self.get_fee_estimator()
         confirmed_only = self.config.WALLET_SPEND_CONFIRMED_ONLY
+        self.main_window.thread.add(
+            partial(self._make_tx, req_gen, fee_estimator, confirmed_only=confirmed_only),
+            on_success=partial(self._on_tx_made, req_gen),
+            on_error=partial(self._on_make_tx_error, req_gen))
+
+    def stop_editor_updates(self):
+        TxEditor.stop_editor_updates(self)
+        # queued requests are skipped. We do not wait for a running one to finish,
+        # its result is dropped.
+        self._req_gen += 1
+
+    def _on_tx_made(self, req_gen, result):
+        if req_gen != self._req_gen or self._editor_updates_stopped:
+            return
+        self.tx, self.not_enough_funds, self.no_dynfee_estimates, self._can_pay_zero_fee = result
+        self._refresh_after_tx_update()
+
+    def _on_make_tx_error(self, req_gen, exc_info):
+        if req_gen != self._req_gen or self._editor_updates_stopped:
+            return
+        self.tx = None
+        self._refresh_after_tx_update()
+        e = exc_info[1]
+        if isinstance(e, InternalAddressCorruption):
+            self.main_window.show_error(str(e))
+        else:
+            self.main_window.on_error(exc_info)
+
+    def _refresh_after_tx_update(self):
+        # as in _do_scheduled_update, ignore update requests caused by refreshing the widgets
+        suppress_updates = not self.needs_update
+        self.needs_update = True
         try:
-            self.tx = self.make_tx(fee_estimator, confirmed_only=confirmed_only)
-            self.not_enough_funds = False
-            self.no_dynfee_estimates = False
+            self.set_locktime()
+            self._update_widgets()
+        finally:
+            if suppress_updates:
+                self.needs_update = False
+
+    def _make_tx(self, req_gen, fee_estimator, *, confirmed_only: bool):
+        """Returns (tx, not_enough_funds, no_dynfee_estimates, can_pay_zero_fee),
+        or None if the request is already outdated. Runs in the task thread, does not touch the GUI.
+        """
+        if req_gen != self._req_gen:
+            return None
+        try:
+            tx = self.make_tx(fee_estimator, confirmed_only=confirmed_only)
         except NotEnoughFunds:
-            self.not_enough_funds = True
-            self.tx = None
-            if fallback_to_zero_fee:
-                try:
-                    self.tx = self.make_tx(0, confirmed_only=confirmed_only)
-                except BaseException:
-                    return
-            else:
-                return
+            tx = None
+            not_enough_funds, no_dynfee_estimates = True, False
         except NoDynamicFeeEstimates:
-            self.no_dynfee_estimates = True
-            self.tx = None
+            no_dynfee_estimates = True
             try:
-                self.tx = self.make_tx(0, confirmed_only=confirmed_only)
+                tx = self.make_tx(0, confirmed_only=confirmed_only)
+                not_enough_funds = False
             except NotEnoughFunds:
-                self.not_enough_funds = True
-                return
+                tx, not_enough_funds = None, True
             except BaseException:
-                return
-        except InternalAddressCorruption as e:
-            self.tx = None
-            self.main_window.show_error(str(e))
-            raise
-        self.tx.set_rbf(True)
+                tx, not_enough_funds = None, False
+        else:
+            not_enough_funds, no_dynfee_estimates = False, False
+        if tx:
+            tx.set_rbf(True)
+        can_pay_zero_fee = {}
+        if not_enough_funds:
+            # needed by _update_widgets to explain the error
+            for c in {False, confirmed_only}:
+                can_pay_zero_fee[c] = self.can_pay_assuming_zero_fees(confirmed_only=c)
+        return tx, not_enough_funds, no_dynfee_estimates, can_pay_zero_fee
 
     def can_pay_assuming_zero_fees(self, confirmed_only) -> bool:
         # called in send_tab.py
@@ -64,7 +64,7 @@ class _BaseRBFDialog(TxEditor):
         self._strategies, def_strat_idx = self.wallet.get_bumpfee_strategies_for_tx(tx=self.old_tx)
         self.method_combo.addItems([strat.text() for strat in self._strategies])
         self.method_combo.setCurrentIndex(def_strat_idx)
-        self.method_combo.currentIndexChanged.connect(self.trigger_update)
+        self._connect(self.method_combo.currentIndexChanged, self.trigger_update)
         self.method_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         old_size_label = TxSizeLabel()
         old_size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -91,7 +91,9 @@ class _BaseRBFDialog(TxEditor):
         return grid
 
     def run(self) -> None:
-        if not self.exec():
+        cancelled = not self.exec()
+        self.stop_editor_updates()
+        if cancelled:
             return
         if self.is_preview:
             self.main_window.show_transaction(self.tx)
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
 class UTXOList(MyTreeView):
     _spend_set: Set[str]  # coins selected by the user to spend from
     _utxo_dict: Dict[str, PartialTxInput]  # coin name -> coin
+    _spend_list: Optional[Sequence[PartialTxInput]]  # snapshot of the coins in _spend_set, see get_spend_list
 
     class Columns(MyTreeView.BaseColumnsEnum):
         OUTPOINT = enum.auto()
@@ -78,6 +79,7 @@ class UTXOList(MyTreeView):
         )
         self._spend_set = set()
         self._utxo_dict = {}
+        self._spend_list = None
         self.wallet = self.main_window.wallet
         self.std_model = QStandardItemModel(self)
         self.proxy = MySortModel(self, sort_role=self.ROLE_SORT_ORDER)
@@ -125,6 +127,7 @@ class UTXOList(MyTreeView):
         self.filter()
         self.proxy.setDynamicSortFilter(True)
         self.sortByColumn(self.Columns.OUTPOINT, Qt.SortOrder.DescendingOrder)
+        self._update_spend_list()
         self.update_coincontrol_bar()
         self.num_coins_label.setText(_('{} unspent transaction outputs').format(len(utxos)))
 
@@ -213,15 +216,25 @@ class UTXOList(MyTreeView):
         self.add_to_coincontrol(coins)
 
     def _refresh_coincontrol(self):
+        self._update_spend_list()
         self.refresh_all()
         self.update_coincontrol_bar()
         self.selectionModel().clearSelection()
 
-    def get_spend_list(self) -> Optional[Sequence[PartialTxInput]]:
+    def _update_spend_list(self) -> None:
         if not bool(self._spend_set):
+            self._spend_list = None
+        else:
+            self._spend_list = tuple(copy.deepcopy([self._utxo_dict[x] for x in self._spend_set]))
+
+    def get_spend_list(self) -> Optional[Sequence[PartialTxInput]]:
+        # note: this can be called from a worker thread (make_tx in ConfirmTxDialog), while the
+        #       GUI thread modifies _spend_set and _utxo_dict. Hence it only reads _spend_list,
+        #       a snapshot that is replaced (never modified) whenever the coin control changes.
+        spend_list = self._spend_list
+        if spend_list is None:
             return None
-        utxos = [self._utxo_dict[x] for x in self._spend_set]
-        return copy.deepcopy(utxos)  # copy so that side-effects don't affect utxo_dict
+        return copy.deepcopy(list(spend_list))  # copy so that side-effects don't affect the snapshot
 
     def _maybe_reset_coincontrol(self, current_wallet_utxos: Sequence[PartialTxInput]) -> None:
         if not bool(self._spend_set):